@@ -1,14 +1,32 @@
-import uuid
+import ast
+import io
+import itertools
+import math
+import re
+import sys
+from array import array
 
 # --- 1. Raw Material Model ---
 class RawMaterial:
     """Represents a basic raw material."""
+    __slots__ = ("name", "_unit_cost", "_cost_str")
+
     def __init__(self, name, unit_cost):
         self.name = name
-        self.unit_cost = unit_cost
+        self._set_unit_cost(unit_cost)
+
+    @property
+    def unit_cost(self):
+        """Read-only; change it with RawMaterialManager.update_material_cost, which keeps its cost array in step."""
+        return self._unit_cost
+
+    def _set_unit_cost(self, value):
+        # Keep the display string in step with the cost so listings don't re-format it.
+        self._unit_cost = value
+        self._cost_str = f"${value:.2f}"
 
     def __str__(self):
-        return f"{self.name} (Cost: ${self.unit_cost:.2f})"
+        return f"{self.name} (Cost: {self._cost_str})"
 
 # --- 2. Raw Material Manager (New Centralized Class) ---
 class RawMaterialManager:
@@ -16,28 +34,74 @@ class RawMaterialManager:
     def __init__(self):
         # {name: RawMaterial_object}
         self.materials = {}
+        # Struct-of-arrays view of the unit costs: {name: material_id} and a
+        # float64 array indexed by material_id, so recipes can gather costs
+        # without walking the RawMaterial objects.
+        self._name_to_idx = {}
+        self._costs = array('d')
+        # Bumped on every mutation so dependent caches can tell they are stale.
+        self._version = 0
 
     def add_material(self, name, cost):
         """Creates and stores a new RawMaterial."""
-        name = name.strip().title()
-        if name in self.materials:
-            print(f"Error: Raw Material '{name}' already exists.")
+        try:
+            self._add_material(name, cost)
+        except ValueError as e:
+            print(f"Error: {e}")
             return False
+        return True
+
+    def _add_material(self, name, cost):
+        """add_material, raising ValueError instead of printing the error."""
+        name = sys.intern(name.strip().title())
+        if name in self.materials:
+            raise ValueError(f"Raw Material '{name}' already exists.")
         
         try:
             cost = float(cost)
         except ValueError:
-            print("Error: Cost must be a number.")
-            return False
+            raise ValueError("Cost must be a number.") from None
 
         self.materials[name] = RawMaterial(name, cost)
+        self._name_to_idx[name] = len(self._costs)
+        self._costs.append(cost)
+        self._version += 1
         print(f"✅ Raw Material '{name}' added with cost ${cost:.2f}.")
+
+    def update_material_cost(self, name, cost):
+        """Changes the unit cost of an existing RawMaterial."""
+        try:
+            self._update_material_cost(name, cost)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return False
         return True
 
+    def _update_material_cost(self, name, cost):
+        """update_material_cost, raising ValueError instead of printing the error."""
+        name = name.strip().title()
+        material = self.materials.get(name)
+        if material is None:
+            raise ValueError(f"Raw Material '{name}' not found.")
+
+        try:
+            cost = float(cost)
+        except ValueError:
+            raise ValueError("Cost must be a number.") from None
+
+        material._set_unit_cost(cost)
+        self._costs[self._name_to_idx[name]] = cost
+        self._version += 1
+        print(f"✅ Raw Material '{name}' cost updated to ${cost:.2f}.")
+
     def get_material(self, name):
         """Retrieves a RawMaterial object by name."""
         return self.materials.get(name.strip().title())
 
+    def get_material_index(self, name):
+        """Retrieves the material id (index into the cost array) by name, or None."""
+        return self._name_to_idx.get(name.strip().title())
+
     def get_all_materials(self):
         """Returns the dictionary of all materials."""
         return self.materials
@@ -53,6 +117,108 @@ class RawMaterialManager:
         print("-" * 35)
 
 
+# --- Price Formula Compilation (used by ProductType) ---
+def _formula_round(x, ndigits=0):
+    """round() for formulas: ndigits may be given as a float, and the result stays a float."""
+    return round(float(x), int(ndigits))
+
+def _formula_result(value):
+    """Checks that a price formula gave a real number (not text or complex) and returns it as a float."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"price formula must give a number, got {value!r}")
+    return float(value)
+
+# Functions a price formula expression is allowed to call. Constants and the
+# rounding functions give floats, so formulas never build (arbitrarily large) ints.
+_FORMULA_FUNCTIONS = {
+    "sqrt": math.sqrt, "log": math.log, "exp": math.exp,
+    "ceil": lambda x: float(math.ceil(x)), "floor": lambda x: float(math.floor(x)),
+    "abs": abs, "min": min, "max": max, "round": _formula_round,
+}
+_FORMULA_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv,
+                      ast.Mod, ast.Pow, ast.UAdd, ast.USub)
+# Largest constant exponent a formula may use; exponents may not contain powers themselves.
+_MAX_FORMULA_EXPONENT = 100
+# Errors a price formula can raise when a product is priced (division by zero,
+# text variables in arithmetic, a variable missing from the values, ...)
+_PRICING_ERRORS = (ArithmeticError, TypeError, KeyError, ValueError)
+# {(expr, var_names): compiled formula}, so each expression is parsed only once.
+_FORMULA_CACHE = {}
+
+class _FormulaRewriter(ast.NodeTransformer):
+    """
+    Validates a formula AST and rewrites variable names into user_variables lookups.
+    Numeric constants become floats, so an overflowing formula raises OverflowError
+    when evaluated instead of computing a huge int.
+    """
+    def __init__(self, var_names):
+        self.var_names = var_names
+
+    def generic_visit(self, node):
+        if not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load) + _FORMULA_OPERATORS):
+            raise ValueError(f"Unsupported syntax in price formula: {type(node).__name__}")
+        return super().generic_visit(node)
+
+    def visit_BinOp(self, node):
+        if isinstance(node.op, ast.Pow):
+            exponent = node.right
+            nested = any(isinstance(sub, ast.BinOp) and isinstance(sub.op, ast.Pow) for sub in ast.walk(exponent))
+            too_large = (isinstance(exponent, ast.Constant) and isinstance(exponent.value, (int, float))
+                         and abs(exponent.value) > _MAX_FORMULA_EXPONENT)
+            if nested or too_large:
+                raise ValueError(f"Exponent too large in price formula: {ast.unparse(node)}")
+        return self.generic_visit(node)
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant in price formula: {node.value!r}")
+        try:
+            return ast.copy_location(ast.Constant(value=float(node.value)), node)
+        except OverflowError:
+            raise ValueError(f"Constant too large in price formula: {node.value}") from None
+
+    def visit_Call(self, node):
+        if not (isinstance(node.func, ast.Name) and node.func.id in _FORMULA_FUNCTIONS) or node.keywords:
+            raise ValueError(f"Unsupported function call in price formula: {ast.unparse(node)}")
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def visit_Name(self, node):
+        if node.id == "material_cost":
+            return node
+        if node.id in self.var_names:
+            return ast.copy_location(
+                ast.Subscript(value=ast.Name(id="user_variables", ctx=ast.Load()),
+                              slice=ast.Constant(value=node.id), ctx=ast.Load()),
+                node)
+        raise ValueError(f"Unknown name in price formula: '{node.id}'")
+
+def compile_price_formula(expr, var_names):
+    """
+    Compiles a formula string such as "material_cost * 1.2 + size_factor * 10"
+    into a function(material_cost, user_variables). Results are cached per
+    (expr, var_names), so repeated compiles of the same formula are free.
+    """
+    key = (expr, tuple(var_names))
+    formula = _FORMULA_CACHE.get(key)
+    if formula is None:
+        try:
+            tree = ast.parse(expr.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid price formula: {e.msg}") from None
+        body = _FormulaRewriter(frozenset(key[1])).visit(tree).body
+        arguments = ast.arguments(posonlyargs=[], args=[ast.arg(arg="material_cost"), ast.arg(arg="user_variables")],
+                                  kwonlyargs=[], kw_defaults=[], defaults=[])
+        # The result goes through _formula_result, so text or complex results fail at pricing time.
+        body = ast.Call(func=ast.Name(id="_formula_result", ctx=ast.Load()), args=[body], keywords=[])
+        lambda_tree = ast.fix_missing_locations(ast.Expression(body=ast.Lambda(args=arguments, body=body)))
+        code = compile(lambda_tree, "<price formula>", "eval")
+        # The tree only holds whitelisted nodes, so no builtins are exposed.
+        formula = eval(code, {"__builtins__": {}, "_formula_result": _formula_result, **_FORMULA_FUNCTIONS})
+        _FORMULA_CACHE[key] = formula
+    return formula
+
+
 # --- 3. Product Type Model (The Standardizer) ---
 class ProductType:
     # ... (The ProductType class remains the same for simplicity)
@@ -62,52 +228,123 @@ class ProductType:
     Defines a standardized recipe for a custom product.
     Includes material proportions, pricing logic, and required user variables.
     """
+    __slots__ = ("name", "description", "materials_recipe", "required_variables",
+                 "_name_to_slot", "_scale_var", "price_formula", "_recipe_version",
+                 "_cached_cost", "_cached_key", "_details_cache")
+
     def __init__(self, name, description):
         self.name = name
         self.description = description
-        # {RawMaterial_name: proportional_factor} e.g., {"Steel": 2.5, "Plastic": 1.0}
-        self.materials_recipe = {}
+        # [(material_id, proportional_factor)], ids from the RawMaterialManager,
+        # e.g. [(0, 2.5), (1, 1.0)] for Steel x2.5 and Plastic x1.0
+        self.materials_recipe = []
+        # {RawMaterial_name: slot in materials_recipe}, for updates and display
+        self._name_to_slot = {}
         # List of variables required from the user when creating a product instance.
         self.required_variables = []
+        # The first required variable scales the material cost; cached for Product.
+        self._scale_var = None
         # Default pricing formula: material cost * 1.5 markup
         self.price_formula = lambda material_cost, vars: material_cost * 1.5
+        # Bumped on every recipe change; part of the cache key below.
+        self._recipe_version = 0
+        # Memoized calculate_material_cost result and the key it was computed for.
+        self._cached_cost = None
+        self._cached_key = None
+        # (cache key, rendered get_details text); cleared when variables change.
+        self._details_cache = None
+
+    def add_material(self, material_name, factor, material_manager):
+        """Adds or updates a raw material (from material_manager) and its proportional factor."""
+        material_id = material_manager.get_material_index(material_name)
+        if material_id is None:
+            print(f"Error: Raw Material '{material_name}' not found in the available list.")
+            return False
 
-    def add_material(self, material_name, factor):
-        """Adds or updates a raw material and its proportional factor."""
-        self.materials_recipe[material_name] = factor
+        material_name = material_manager.get_material(material_name).name
+        slot = self._name_to_slot.get(material_name)
+        if slot is None:
+            self._name_to_slot[material_name] = len(self.materials_recipe)
+            self.materials_recipe.append((material_id, factor))
+        else:
+            self.materials_recipe[slot] = (material_id, factor)
+        self._recipe_version += 1
+        return True
 
     def add_variable(self, variable_name):
         """Adds a user-required variable."""
+        # Interned so user-variable dicts keyed by these names hit the identity fast path.
+        variable_name = sys.intern(variable_name)
         if variable_name not in self.required_variables:
             self.required_variables.append(variable_name)
-
-    def calculate_material_cost(self, all_materials):
+            self._details_cache = None
+            if self._scale_var is None:
+                self._scale_var = variable_name
+
+    def set_price_formula(self, formula):
+        """Sets the pricing formula, called as formula(material_cost, user_variables)."""
+        if not callable(formula):
+            raise TypeError("Price formula must be callable.")
+        self.price_formula = formula
+
+    def set_price_formula_expr(self, expr, var_names=None):
+        """Sets the pricing formula from an expression string over material_cost and the given variables."""
+        if var_names is None:
+            var_names = self.required_variables
+        self.price_formula = compile_price_formula(expr, var_names)
+
+    def price_many(self, material_costs, user_variables_list):
+        """Applies the pricing formula to parallel sequences of material costs and user variables."""
+        return list(map(self.price_formula, material_costs, user_variables_list))
+
+    def scaling_factor(self, user_variables):
+        """Returns the scale variable's value (1 if not given); raises TypeError if it is not a number."""
+        if self._scale_var is None:
+            return 1
+        value = user_variables.get(self._scale_var, 1)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"variable '{self._scale_var}' must be a number, got '{value}'")
+        return value
+
+    def _cache_key(self, material_manager):
+        """Identifies the recipe and material state that cached values were computed from."""
+        return (self._recipe_version, material_manager, material_manager._version)
+
+    def calculate_material_cost(self, material_manager):
         """Calculates the total material cost for a standard unit of this product type."""
-        total_cost = 0
-        for mat_name, factor in self.materials_recipe.items():
-            material = all_materials.get(mat_name)
-            if material:
-                total_cost += material.unit_cost * factor
-        return total_cost
-
-    def get_details(self, all_materials):
+        key = self._cache_key(material_manager)
+        if self._cached_key != key:
+            costs = material_manager._costs
+            self._cached_cost = sum((costs[i] * factor for i, factor in self.materials_recipe), 0.0)
+            self._cached_key = key
+        return self._cached_cost
+
+    def get_details(self, material_manager):
         """Returns a string summary of the product type."""
-        details = [
-            f"  Name: {self.name}",
-            f"  Description: {self.description}",
-            f"  Required Variables: {', '.join(self.required_variables) if self.required_variables else 'None'}",
-            "  --- Recipe (Standardized Proportions) ---"
-        ]
-        for mat_name, factor in self.materials_recipe.items():
-            material = all_materials.get(mat_name)
-            cost_contribution = material.unit_cost * factor if material else 0
-            details.append(f"    - {mat_name}: Factor {factor} (Cost Contribution: ${cost_contribution:.2f})")
+        key = self._cache_key(material_manager)
+        if self._details_cache is not None and self._details_cache[0] == key:
+            return self._details_cache[1]
+
+        buf = io.StringIO()
+        buf.write(f"  Name: {self.name}\n")
+        buf.write(f"  Description: {self.description}\n")
+        buf.write(f"  Required Variables: {', '.join(self.required_variables) if self.required_variables else 'None'}\n")
+        buf.write("  --- Recipe (Standardized Proportions) ---\n")
+
+        costs = material_manager._costs
+        recipe = self.materials_recipe
+        for mat_name, slot in self._name_to_slot.items():
+            material_id, factor = recipe[slot]
+            cost_contribution = costs[material_id] * factor
+            buf.write(f"    - {mat_name}: Factor {factor} (Cost Contribution: ${cost_contribution:.2f})\n")
         
-        std_cost = self.calculate_material_cost(all_materials)
-        details.append(f"  Standard Material Cost (per factor): ${std_cost:.2f}")
-        details.append("  *Final Price is calculated using the custom formula on product creation.*")
+        std_cost = self.calculate_material_cost(material_manager)
+        buf.write(f"  Standard Material Cost (per factor): ${std_cost:.2f}\n")
+        buf.write("  *Final Price is calculated using the custom formula on product creation.*")
         
-        return "\n".join(details)
+        details = buf.getvalue()
+        self._details_cache = (key, details)
+        return details
 
 
 # --- 4. Product Instance Model ---
@@ -115,23 +352,40 @@ class Product:
     # ... (The Product class remains the same)
     
     """Represents an individual manufactured product based on a ProductType."""
-    def __init__(self, product_type, user_variables, all_materials):
-        self.id = uuid.uuid4()
+    __slots__ = ("id", "product_type", "user_variables", "material_cost", "final_price")
+
+    # Monotonic in-memory ids; cheaper than a uuid4 (no OS entropy per product).
+    _id_seq = itertools.count(1)
+
+    def __init__(self, product_type, user_variables, material_manager):
         self.product_type = product_type
         self.user_variables = user_variables
         self.material_cost = 0
         self.final_price = 0
         
-        self._evaluate_cost_and_price(all_materials)
-
-    def _evaluate_cost_and_price(self, all_materials):
+        self._evaluate_cost_and_price(material_manager)
+        # Taken only once pricing succeeded, so failed products leave no gaps in the ids.
+        self.id = next(Product._id_seq)
+
+    @classmethod
+    def _from_priced(cls, product_type, user_variables, material_cost, final_price):
+        """Builds a product from an already computed cost and price, skipping evaluation."""
+        product = cls.__new__(cls)
+        product.id = next(cls._id_seq)
+        product.product_type = product_type
+        product.user_variables = user_variables
+        product.material_cost = material_cost
+        product.final_price = final_price
+        return product
+
+    def _evaluate_cost_and_price(self, material_manager):
         """Calculates the final cost and price based on the product type's recipe and user variables."""
         
         # 1. Base Material Cost from Product Type (Standardized)
-        base_cost = self.product_type.calculate_material_cost(all_materials)
+        base_cost = self.product_type.calculate_material_cost(material_manager)
         
         # 2. Apply a scaling factor from user input (example logic)
-        scaling_factor = self.user_variables.get(self.product_type.required_variables[0], 1) if self.product_type.required_variables else 1
+        scaling_factor = self.product_type.scaling_factor(self.user_variables)
         
         self.material_cost = base_cost * scaling_factor
         
@@ -140,12 +394,19 @@ class Product:
 
     def __str__(self):
         vars_str = ', '.join([f"{k}: {v}" for k, v in self.user_variables.items()])
-        return (f"Product ID: {str(self.id).split('-')[0]} | Type: {self.product_type.name}\n"
+        return (f"Product ID: {self.id:08x} | Type: {self.product_type.name}\n"
                 f"  Variables: {vars_str}\n"
                 f"  Material Cost: ${self.material_cost:.2f} | Final Price: ${self.final_price:.2f}")
 
 
 # --- 5. Product Manager (The System Controller) ---
+# Scripted command line: "<command> <args>", e.g. "recipe Frame, Steel, 2.5"
+_CMD_RE = re.compile(r"^(?P<cmd>\w+)\s*(?P<args>.*)$")
+# Comma-separated "name=value" pairs, e.g. "size_factor=2, color=red"
+_VAR_PAIR_RE = re.compile(r"\s*([^=,]+?)\s*=\s*([^,]*?)\s*(?:,|$)")
+# Variable values that are stored as numbers rather than text, e.g. "2", "-0.5", "1e3"
+_NUM_RE = re.compile(r"^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$")
+
 class ProductManager:
     """Manages Product Types and Products, handles user interaction."""
     def __init__(self):
@@ -159,6 +420,46 @@ class ProductManager:
         self.material_manager.add_material("Plastic", 1.50)
         self.material_manager.add_material("Wood", 3.00)
 
+        # Main menu text and {choice: handler} table, built once for run()
+        self._menu = (
+            "\n" + "=" * 40 + "\n"
+            "Main Menu:\n"
+            "1. Create New Product Type\n"
+            "2. View Existing Product Types\n"
+            "3. Modify Existing Product Type\n"
+            "4. Create New Product (Instance)\n"
+            "5. View All Products\n"
+            "--- Raw Material Management ---\n"
+            "6. **VIEW** Available Raw Materials\n"
+            "7. **CREATE** New Raw Material\n"
+            "8. Exit\n"
+            + "=" * 40 + "\n"
+        )
+        self._menu_actions = {
+            "1": self.create_new_product_type,
+            "2": self.view_existing_product_types,
+            "3": self.modify_existing_product_type,
+            "4": self.create_product_instance,
+            "5": self.view_all_products,
+            "6": self.material_manager.view_materials,
+            "7": self.add_new_raw_material,
+            "8": self._exit,
+        }
+        self._running = False
+
+        # {script command: handler(args)} used by run_script
+        self._script_commands = {
+            "material": self._script_add_material,
+            "material_cost": self._script_update_material_cost,
+            "type": self._script_add_product_type,
+            "recipe": self._script_add_recipe_material,
+            "variable": self._script_add_variable,
+            "formula": self._script_set_price_formula,
+            "product": self._script_create_product,
+            "view_materials": lambda args: self.material_manager.view_materials(),
+            "view_types": lambda args: self.view_existing_product_types(),
+            "view_products": lambda args: self.view_all_products(),
+        }
 
     def _get_input(self, prompt, type_cast=str):
         """Helper for robust input."""
@@ -205,7 +506,7 @@ class ProductManager:
             mat_name = self._get_input("Enter Raw Material Name").title()
             if mat_name in available_materials:
                 factor = self._get_input(f"Enter proportional factor for {mat_name} (e.g., 2.5)", float)
-                new_type.add_material(mat_name, factor)
+                new_type.add_material(mat_name, factor, self.material_manager)
             else:
                 print(f"Error: Raw Material '{mat_name}' not found in the available list.")
 
@@ -226,11 +527,10 @@ class ProductManager:
             print("No product types have been defined yet.")
             return
 
-        all_materials = self.material_manager.get_all_materials()
         for name, p_type in self.product_types.items():
             print("-" * 40)
-            # Pass the material list from the manager
-            print(p_type.get_details(all_materials))
+            # Pass the material manager (costs are gathered from its arrays)
+            print(p_type.get_details(self.material_manager))
         print("-" * 40)
 
     def modify_existing_product_type(self):
@@ -250,14 +550,15 @@ class ProductManager:
         print(f"Modifying Product Type: {name}")
         print("1. Add/Update Raw Material Proportion")
         print("2. Add Required Variable")
-        choice = self._get_input("Enter choice (1 or 2)", int)
+        print("3. Set Price Formula")
+        choice = self._get_input("Enter choice (1-3)", int)
 
         if choice == 1:
             self.material_manager.view_materials()
             mat_name = self._get_input("Enter Raw Material Name").title()
             if mat_name in self.material_manager.get_all_materials():
                 factor = self._get_input(f"Enter NEW proportional factor for {mat_name}", float)
-                p_type.add_material(mat_name, factor)
+                p_type.add_material(mat_name, factor, self.material_manager)
                 print(f"✅ Recipe updated for {name}.")
             else:
                 print(f"Error: Raw Material '{mat_name}' not found in the available list.")
@@ -265,6 +566,14 @@ class ProductManager:
             var_name = self._get_input("Enter NEW Variable Name").lower().replace(" ", "_")
             p_type.add_variable(var_name)
             print(f"✅ Variable '{var_name}' added to {name}.")
+        elif choice == 3:
+            print(f"Available names: material_cost{''.join(', ' + v for v in p_type.required_variables)}")
+            expr = self._get_input("Enter price formula (e.g., 'material_cost * 1.5')")
+            try:
+                p_type.set_price_formula_expr(expr)
+                print(f"✅ Price formula updated for {name}.")
+            except ValueError as e:
+                print(f"Error: {e}")
         else:
             print("Invalid choice.")
             
@@ -291,60 +600,179 @@ class ProductManager:
         user_vars = {}
         for var_name in p_type.required_variables:
             value = self._get_input(f"Enter value for dependent variable '{var_name}'")
-            try:
-                user_vars[var_name] = float(value)
-            except ValueError:
-                user_vars[var_name] = value
+            user_vars[var_name] = float(value) if _NUM_RE.match(value) else value
 
-        # Pass the material list from the manager
-        new_product = Product(p_type, user_vars, self.material_manager.get_all_materials())
+        new_product = self._build_product(p_type, user_vars)
+        if new_product is None:
+            return
         self.products.append(new_product)
         print("\n✅ Product created:")
         print(new_product)
 
+    def _build_product(self, product_type, user_vars):
+        """Creates a Product, or reports the error and returns None if its price formula fails."""
+        try:
+            return self._new_product(product_type, user_vars)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return None
+
+    def _new_product(self, product_type, user_vars):
+        """Creates a Product; raises ValueError if it cannot be priced."""
+        try:
+            return Product(product_type, user_vars, self.material_manager)
+        except _PRICING_ERRORS as e:
+            raise ValueError(f"could not price '{product_type.name}' product ({type(e).__name__}: {e}).") from None
+
+    def create_products_bulk(self, product_type, user_vars_list):
+        """
+        Creates one product per user-variables dict in user_vars_list.
+        The standard material cost is computed once and the price formula is
+        applied over the whole batch, instead of evaluating each Product.
+        Products whose price formula fails are reported and skipped.
+        """
+        user_vars_list = list(user_vars_list)
+        base_cost = product_type.calculate_material_cost(self.material_manager)
+        try:
+            material_costs = [base_cost * product_type.scaling_factor(user_vars) for user_vars in user_vars_list]
+            final_prices = product_type.price_many(material_costs, user_vars_list)
+        except _PRICING_ERRORS:
+            # Some product failed to price; build them one by one so only those are skipped.
+            new_products = [product for product in (self._build_product(product_type, user_vars)
+                                                    for user_vars in user_vars_list)
+                            if product is not None]
+        else:
+            new_products = list(map(Product._from_priced, itertools.repeat(product_type),
+                                    user_vars_list, material_costs, final_prices))
+        self.products.extend(new_products)
+        return new_products
+
+    def view_all_products(self):
+        """Displays all created product instances."""
+        print("\n--- 📦 All Products Created ---")
+        if not self.products:
+            print("No products have been created yet.")
+        for product in self.products:
+            print("-" * 40)
+            print(product)
+        print("-" * 40)
+
+    # --- Scripted (Non-Interactive) Commands ---
+    def run_script(self, lines):
+        """
+        Runs commands from an iterable of lines (e.g. an open file) without prompting.
+        Blank lines and lines starting with '#' are skipped; a line that fails is
+        reported with its line number and the script carries on. Commands:
+          material <name>, <cost>            material_cost <name>, <cost>
+          type <name>, <description>         recipe <type>, <material>, <factor>
+          variable <type>, <variable>        formula <type>, <expression>
+          product <type>[, var=value, ...]   view_materials | view_types | view_products
+        """
+        for line_no, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            match = _CMD_RE.match(line)
+            handler = self._script_commands.get(match.group("cmd")) if match else None
+            try:
+                if handler is None:
+                    raise ValueError(f"unknown command '{line.split()[0]}'.")
+                handler(match.group("args"))
+            except Exception as e:
+                # Handlers raise ValueError with a readable message; anything else is unexpected.
+                message = str(e) if isinstance(e, ValueError) else f"{type(e).__name__}: {e}"
+                print(f"Error: line {line_no}: {message}")
+
+    # Script handlers raise ValueError for a bad line; run_script reports it with the line number.
+    def _script_args(self, args, count):
+        """Splits comma-separated script arguments; the last one keeps any further commas."""
+        parts = [part.strip() for part in args.split(",", count - 1)]
+        if len(parts) != count or not all(parts):
+            raise ValueError(f"expected {count} comma-separated arguments, got '{args}'.")
+        return parts
+
+    def _script_product_type(self, name):
+        """Looks up a ProductType by name, raising ValueError if it does not exist."""
+        p_type = self.product_types.get(name)
+        if not p_type:
+            raise ValueError(f"Product Type '{name}' not found.")
+        return p_type
+
+    def _script_add_material(self, args):
+        """material <name>, <cost>"""
+        self.material_manager._add_material(*self._script_args(args, 2))
+
+    def _script_update_material_cost(self, args):
+        """material_cost <name>, <cost>"""
+        self.material_manager._update_material_cost(*self._script_args(args, 2))
+
+    def _script_add_product_type(self, args):
+        """type <name>, <description>"""
+        name, description = self._script_args(args, 2)
+        if name in self.product_types:
+            raise ValueError(f"Product Type '{name}' already exists.")
+        self.product_types[name] = ProductType(name, description)
+        print(f"✅ Product Type '{name}' created successfully!")
+
+    def _script_add_recipe_material(self, args):
+        """recipe <type>, <material>, <factor>"""
+        type_name, mat_name, factor = self._script_args(args, 3)
+        p_type = self._script_product_type(type_name)
+        mat_name = mat_name.title()
+        if mat_name not in self.material_manager.get_all_materials():
+            raise ValueError(f"Raw Material '{mat_name}' not found in the available list.")
+        try:
+            factor = float(factor)
+        except ValueError:
+            raise ValueError("Factor must be a number.") from None
+        p_type.add_material(mat_name, factor, self.material_manager)
+
+    def _script_add_variable(self, args):
+        """variable <type>, <variable>"""
+        type_name, var_name = self._script_args(args, 2)
+        self._script_product_type(type_name).add_variable(var_name.lower().replace(" ", "_"))
+
+    def _script_set_price_formula(self, args):
+        """formula <type>, <expression>"""
+        type_name, expr = self._script_args(args, 2)
+        self._script_product_type(type_name).set_price_formula_expr(expr)
+
+    def _script_create_product(self, args):
+        """product <type>[, var=value, ...]"""
+        type_name, _, pairs = args.partition(",")
+        p_type = self._script_product_type(type_name.strip())
+        values = dict(_VAR_PAIR_RE.findall(pairs)) if pairs.strip() else {}
+        missing = [var_name for var_name in p_type.required_variables if not values.get(var_name)]
+        if missing:
+            raise ValueError(f"missing value for variable(s): {', '.join(missing)}.")
+
+        user_vars = {}
+        for var_name in p_type.required_variables:
+            value = values[var_name]
+            user_vars[var_name] = float(value) if _NUM_RE.match(value) else value
+
+        new_product = self._new_product(p_type, user_vars)
+        self.products.append(new_product)
+        print(f"✅ Product created: {new_product.id:08x}")
+
     # --- Main Application Loop (Updated Menu) ---
+    def _exit(self):
+        """Ends the main loop."""
+        print("Thank you for using the system. Goodbye!")
+        self._running = False
+
     def run(self):
         """The main command-line interface loop."""
         print("--- Custom Manufacturing Product System ---")
-        while True:
-            print("\n" + "="*40)
-            print("Main Menu:")
-            print("1. Create New Product Type")
-            print("2. View Existing Product Types")
-            print("3. Modify Existing Product Type")
-            print("4. Create New Product (Instance)")
-            print("5. View All Products")
-            print("--- Raw Material Management ---")
-            print("6. **VIEW** Available Raw Materials")
-            print("7. **CREATE** New Raw Material")
-            print("8. Exit")
-            print("="*40)
+        self._running = True
+        while self._running:
+            sys.stdout.write(self._menu)
 
             choice = self._get_input("Enter your choice (1-8)", str)
             
-            if choice == '1':
-                self.create_new_product_type()
-            elif choice == '2':
-                self.view_existing_product_types()
-            elif choice == '3':
-                self.modify_existing_product_type()
-            elif choice == '4':
-                self.create_product_instance()
-            elif choice == '5':
-                print("\n--- 📦 All Products Created ---")
-                if not self.products:
-                    print("No products have been created yet.")
-                for product in self.products:
-                    print("-" * 40)
-                    print(product)
-                print("-" * 40)
-            elif choice == '6':
-                self.material_manager.view_materials()
-            elif choice == '7':
-                self.add_new_raw_material()
-            elif choice == '8':
-                print("Thank you for using the system. Goodbye!")
-                break
+            handler = self._menu_actions.get(choice)
+            if handler:
+                handler()
             else:
                 print("Invalid choice. Please enter a number between 1 and 8.")
 
@@ -352,4 +780,9 @@ class ProductManager:
 # --- Execution ---
 if __name__ == "__main__":
     manager = ProductManager()
-    manager.run()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        # Non-interactive mode: python Classtest.py commands.txt
+        with open(sys.argv[1], encoding="utf-8") as script:
+            manager.run_script(script)
+    else:
+        manager.run()
\ No newline at end of file
@@ -1,4 +1,8 @@
 # pricing_data.py
+import sys
+from bisect import bisect_right
+from enum import IntEnum
+from types import MappingProxyType, SimpleNamespace
 
 # A. Global Constants (To be editable)
 CONSTANTS = {
@@ -54,4 +58,106 @@ ADDON_SQFT_RATES = {
     "Grooving_Both_Sides": 22.00,
     "Routing_One_Side": 15.00,
     "Routing_Both_Sides": 28.00,
-}
\ No newline at end of file
+}
+
+# G. Derived Lookup Tables (built once at import from the editable data above)
+# Add-on keys of ADDON_SQFT_RATES ("Feature_Option_Sides") as enums, so rates
+# can be held in a dense [feature][option][sides] table. Keys that do not fit
+# these enums stay reachable via ADDON_SQFT_RATES only.
+class Feature(IntEnum):
+    COATING = 0
+    GROOVING = 1
+    ROUTING = 2
+
+class Option(IntEnum):
+    PLAIN = 0  # No named option, e.g. "Grooving_One_Side"
+    RESIN_COATED = 1
+
+class Sides(IntEnum):
+    ONE_SIDE = 0
+    BOTH_SIDES = 1
+
+def parse_addon_key(key):
+    """Splits an ADDON_SQFT_RATES key into (Feature, Option, Sides), or None if it does not fit."""
+    feature_name, _, rest = key.partition("_")
+    for sides in Sides:
+        suffix = sides.name.title()  # e.g. "One_Side"
+        if rest.endswith(suffix):
+            option_name = rest[:-len(suffix)].rstrip("_").upper() or Option.PLAIN.name
+            if feature_name.upper() in Feature.__members__ and option_name in Option.__members__:
+                return Feature[feature_name.upper()], Option[option_name], sides
+    return None
+
+def _bootstrap():
+    """
+    Builds every derived fast-path table in a single pass over the data above.
+    Mappings are exposed as read-only views; matrices are nested tuples.
+    """
+    nan = float("nan")
+
+    # Material base rates as a dense [rails][filler] matrix indexed by material
+    # id; NaN marks combinations that have no rate defined. Names are interned,
+    # so callers passing interned names get identity-fast dict hits.
+    material_names = tuple(sorted({sys.intern(name) for pair in MATERIAL_BASE_RATES for name in pair}))
+    material_index = {name: i for i, name in enumerate(material_names)}
+    rate_rows = [[nan] * len(material_names) for _ in material_names]
+    for (rails, filler), rate in MATERIAL_BASE_RATES.items():
+        rate_rows[material_index[rails]][material_index[filler]] = rate
+
+    # Vision hole bands sorted by T_min as parallel tuples, for binary search.
+    vh_bands = sorted(VISION_HOLE_FEES, key=lambda band: band["T_min"])
+
+    # Add-on rates as a dense [feature][option][sides] table; NaN if undefined.
+    addon_cells = [[[nan] * len(Sides) for _ in Option] for _ in Feature]
+    for key, rate in ADDON_SQFT_RATES.items():
+        parsed = parse_addon_key(key)
+        if parsed is not None:
+            feature, option, sides = parsed
+            addon_cells[feature][option][sides] = rate
+
+    return SimpleNamespace(
+        material_names=material_names,
+        material_index=MappingProxyType(material_index),
+        rate_matrix=tuple(tuple(row) for row in rate_rows),
+        vh_edges=tuple(band["T_min"] for band in vh_bands),
+        vh_tmax=tuple(band["T_max"] for band in vh_bands),
+        vh_fees=tuple(band["F_VH"] for band in vh_bands),
+        addon_cube=tuple(tuple(tuple(row) for row in plane) for plane in addon_cells),
+        # Laminate is a fixed per-door fee, so it is stored already rounded to paise.
+        laminate_rates=MappingProxyType({name: round(rate, 2) for name, rate in LAMINATE_RATES.items()}),
+    )
+
+TABLES = _bootstrap()
+
+def base_rate(rails, filler):
+    """Returns R_base (INR/sqft) for a rails/filler pair, NaN if the combination is not priced."""
+    rails_id = TABLES.material_index.get(rails)
+    filler_id = TABLES.material_index.get(filler)
+    if rails_id is None or filler_id is None:
+        return float("nan")
+    return TABLES.rate_matrix[rails_id][filler_id]
+
+def base_rate_batch(rails_idx, filler_idx):
+    """Returns R_base for parallel sequences of material ids (see TABLES.material_index)."""
+    rate_matrix = TABLES.rate_matrix
+    return [rate_matrix[i][j] for i, j in zip(rails_idx, filler_idx)]
+
+def vision_hole_fee(T_mm):
+    """Returns the vision hole fee (INR) for a door thickness, 0.0 if no band covers it."""
+    i = bisect_right(TABLES.vh_edges, T_mm) - 1
+    if i >= 0 and T_mm <= TABLES.vh_tmax[i]:
+        return TABLES.vh_fees[i]
+    return 0.0
+
+def vision_hole_fee_batch(thicknesses):
+    """Returns the vision hole fee for each thickness in a sequence."""
+    return [vision_hole_fee(T_mm) for T_mm in thicknesses]
+
+def addon_rate(feature, option, sides):
+    """Returns the add-on rate (INR/sqft) for a Feature/Option/Sides triple, NaN if not defined."""
+    return TABLES.addon_cube[feature][option][sides]
+
+def addon_rate_batch(features, options, sides):
+    """Returns the add-on rate for parallel sequences of Feature, Option and Sides values."""
+    addon_cube = TABLES.addon_cube
+    return [addon_cube[f][o][s] for f, o, s in zip(features, options, sides)]
@@ -1,23 +1,111 @@
 # pricing_logic.py
-from pricing_data import CONSTANTS, MATERIAL_BASE_RATES, CORE_SURCHARGES, \
-                         LAMINATE_RATES, VENEER_RATES, VISION_HOLE_FEES, \
-                         ADDON_SQFT_RATES
+import functools
+import logging
+import math
+import operator
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+
+from pricing_data import CONSTANTS, CORE_SURCHARGES, VENEER_RATES, \
+                         ADDON_SQFT_RATES, TABLES, addon_rate, base_rate, parse_addon_key, \
+                         vision_hole_fee, vision_hole_fee_batch
+
+logger = logging.getLogger(__name__)
+
+# Pricing constants bound once at import (saves a dict lookup per use)
+_SQMM_TO_SQFT = CONSTANTS["SQMM_TO_SQFT"]
+_T_BASE = CONSTANTS["BASE_THICKNESS_MM"]
+_S_INC = CONSTANTS["THICKNESS_SURCHARGE_RATE"]
+_DL_FACTOR = CONSTANTS["DOUBLE_LEAF_FACTOR"]
+_EB_RATE = CONSTANTS["EDGE_BANDING_RATE"]
+_LAMINATE_RATES = TABLES.laminate_rates  # Fixed per-door fees, pre-rounded
+# Quotes are rounded to whole paise (integer INR * 100) and converted back to INR at the result
+_PAISE_PER_INR = 100
+
+# Add-on selections normalized once at the API boundary: booleans for the
+# yes/no flags, and the option name (or None) for the area-based add-ons.
+AddOns = namedtuple("AddOns", ["double_leaf", "vision_hole", "edge_banding", "coating", "grooving", "routing"])
+
+def _addon_option(add_ons, key):
+    """Returns the selected option for an area add-on, or None if it is 'none'/absent."""
+    value = add_ons.get(key, 'none')
+    return None if value.lower() == 'none' else value
+
+def _normalize_addons(add_ons):
+    """Converts an add-ons dict ('yes'/'no' flags, option names or 'none') into AddOns."""
+    if isinstance(add_ons, AddOns):
+        return add_ons
+    return AddOns(
+        double_leaf=add_ons.get('double_leaf', 'no').lower() == 'yes',
+        vision_hole=add_ons.get('vision_hole', 'no').lower() == 'yes',
+        edge_banding=add_ons.get('edge_banding', 'yes').lower() == 'yes',
+        coating=_addon_option(add_ons, 'coating'),
+        grooving=_addon_option(add_ons, 'grooving'),
+        routing=_addon_option(add_ons, 'routing'),
+    )
+
+# Area-based add-ons as (AddOns field, ADDON_SQFT_RATES prefix)
+_AREA_ADDONS = (('coating', 'Coating'), ('grooving', 'Grooving'), ('routing', 'Routing'))
+
+def _addon_lookup_key(prefix, option):
+    """Builds the ADDON_SQFT_RATES key for an option, e.g. 'Resin Coated (Both Sides)' -> 'Coating_Resin_Coated_Both_Sides'."""
+    return f"{prefix}_{'_'.join(option.split()).replace('(', '').replace(')', '')}"
+
+def _build_addon_cell_index():
+    """
+    Maps (prefix, option as entered) -> (Feature, Option, Sides) cell of
+    TABLES.addon_cube for every ADDON_SQFT_RATES key that fits the enums, in
+    both spellings that resolve to it, e.g. 'Resin Coated (Both Sides)' and
+    'Resin Coated Both Sides', so pricing needs no per-call string rebuilding.
+    """
+    index = {}
+    for key in ADDON_SQFT_RATES:
+        cell = parse_addon_key(key)
+        if cell is None:
+            continue
+        prefix, _, rest = key.partition("_")
+        words = rest.split("_")
+        options = {" ".join(words)}
+        if len(words) > 2 and words[-1] in ("Side", "Sides"):
+            options.add(f"{' '.join(words[:-2])} ({' '.join(words[-2:])})")
+        for option in options:
+            if _addon_lookup_key(prefix, option) == key:
+                index[(prefix, option)] = cell
+    return index
+
+_ADDON_CELL_BY_TUPLE = _build_addon_cell_index()
+
+def _area_addon_rate(prefix, option):
+    """Returns the sqft rate for an area add-on option, or None (logged at DEBUG) if it is not priced."""
+    cell = _ADDON_CELL_BY_TUPLE.get((prefix, option))
+    if cell is not None:
+        rate = addon_rate(*cell)
+    else:
+        # Other spellings (extra spaces etc.) and keys outside the enums still
+        # resolve through the key format.
+        rate = ADDON_SQFT_RATES.get(_addon_lookup_key(prefix, option))
+    if not rate and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Add-on rate not found for key: %s", _addon_lookup_key(prefix, option))
+    return rate
 
 # --- Helper Functions (Ensuring Availability) ---
+# sqmm -> sqft as a multiplier (one FMUL instead of an FDIV per area)
+_SQMM_TO_SQFT_INV = 1.0 / _SQMM_TO_SQFT
 
+# Standard door sizes repeat across quotes, so the pure area helpers are memoized.
+@functools.lru_cache(maxsize=4096)
 def calculate_area_sqft(L_mm, W_mm, factor=1):
     """Calculates door surface area in sqft, multiplied by factor (e.g., 2 for both sides)."""
-    conversion = CONSTANTS["SQMM_TO_SQFT"]
     area_mm2 = L_mm * W_mm
-    return round(area_mm2 / conversion * factor, 4)
+    return area_mm2 * _SQMM_TO_SQFT_INV * factor
 
+@functools.lru_cache(maxsize=4096)
 def calculate_edge_area_sqft(L_mm, W_mm, T_mm):
     """
     Calculates the total edge surface area in sqft.
     Formula: [2 * (L_mm + W_mm) * T_mm] / SQMM_TO_SQFT
     """
-    conversion = CONSTANTS["SQMM_TO_SQFT"]
-    
     # Perimeter (L + W) * 2
     perimeter_mm = 2 * (L_mm + W_mm)
     
@@ -25,124 +113,329 @@ def calculate_edge_area_sqft(L_mm, W_mm, T_mm):
     edge_area_mm2 = perimeter_mm * T_mm
     
     # Conversion to sqft
-    edge_area_sqft = edge_area_mm2 / conversion
+    edge_area_sqft = edge_area_mm2 * _SQMM_TO_SQFT_INV
     
-    return round(edge_area_sqft, 4)
+    return edge_area_sqft
 
 # --- Core Logic Functions (Fixes applied primarily to get_psf_rate) ---
 
-def get_psf_rate(rails_material, filler_material, T_mm, core_option):
-    """Calculates the final dynamic PSF Rate (INR/sqft) for the door skeleton."""
-    T_base = CONSTANTS["BASE_THICKNESS_MM"]
-    S_inc = CONSTANTS["THICKNESS_SURCHARGE_RATE"]
-    
-    # 1. Base Material Lookup
-    material_key = (rails_material, filler_material)
-    R_base = MATERIAL_BASE_RATES.get(material_key)
-    if R_base is None:
-        raise ValueError(f"Pricing not defined for material combination: {material_key}")
-
-    # 2. Thickness Surcharge
-    thickness_increase = max(0, T_mm - T_base)
-    thickness_surcharge = thickness_increase * S_inc
-    PSF_rate = R_base + thickness_surcharge
-    
-    # 3. Conditional Core Surcharge
+# Core options and door types as integer enums, parsed once at the API
+# boundary so the hot path compares and indexes ints instead of strings.
+class CoreOption(IntEnum):
+    SINGLE = 0
+    DOUBLE = 1
+    CORE_HDF = 2
+
+class DoorType(IntEnum):
+    LAMINATE = 0
+    VENEER = 1
+
+# Core option names -> CoreOption; options not listed price like "Single Core".
+CORE_ID = {"Single Core": CoreOption.SINGLE, "Double Core": CoreOption.DOUBLE, "Core + HDF": CoreOption.CORE_HDF}
+# Door type names -> DoorType; other door types carry no finish cost.
+DOOR_TYPE_ID = {"Laminate": DoorType.LAMINATE, "Veneer": DoorType.VENEER}
+
+def _parse_core(core_option):
+    """
+    Returns the CoreOption for a core option name, CoreOption or integer id.
+    Unknown names price as SINGLE; unknown ids raise ValueError, other types TypeError.
+    """
+    if isinstance(core_option, CoreOption):
+        return core_option
+    if isinstance(core_option, str):
+        return CORE_ID.get(core_option, CoreOption.SINGLE)
+    return CoreOption(operator.index(core_option))
+
+def _parse_door_type(door_type):
+    """
+    Returns the DoorType for a door type name, DoorType or integer id. Returns
+    None for names without finish pricing, and passes None through unchanged.
+    Unknown ids raise ValueError, other types TypeError.
+    """
+    if door_type is None or isinstance(door_type, DoorType):
+        return door_type
+    if isinstance(door_type, str):
+        return DOOR_TYPE_ID.get(door_type)
+    return DoorType(operator.index(door_type))
+
+# Core surcharge (INR/sqft) per core id, one table per thickness bucket:
+# up to 35mm the full surcharge applies; from 36mm the core is already double,
+# so only Core + HDF pays the difference. Thicknesses in between pay none.
+_CORE_TABLE_LE35 = (0.0, CORE_SURCHARGES["Double Core"], CORE_SURCHARGES["Core + HDF"])
+_CORE_TABLE_GE36 = (0.0, 0.0, CORE_SURCHARGES["Core + HDF"] - CORE_SURCHARGES["Double Core"])
+_CORE_TABLE_NONE = (0.0, 0.0, 0.0)
+
+def _thickness_terms(T_mm):
+    """Returns (thickness surcharge, core surcharge table) for a door thickness."""
+    thickness_increase = max(0, T_mm - _T_BASE)
+    thickness_surcharge = thickness_increase * _S_INC
     if T_mm <= 35:
-        if core_option == "Double Core":
-            PSF_rate += CORE_SURCHARGES["Double Core"]
-        elif core_option == "Core + HDF":
-            PSF_rate += CORE_SURCHARGES["Core + HDF"]
-    
+        core_table = _CORE_TABLE_LE35
     elif T_mm >= 36:
-        if core_option == "Core + HDF":
-            h_df_cost = CORE_SURCHARGES["Core + HDF"]
-            dc_cost = CORE_SURCHARGES["Double Core"]
-            differential_surcharge = h_df_cost - dc_cost
-            PSF_rate += differential_surcharge
+        core_table = _CORE_TABLE_GE36
+    else:
+        core_table = _CORE_TABLE_NONE
+    return thickness_surcharge, core_table
+
+def _material_base_rate(rails_material, filler_material):
+    """Returns R_base (INR/sqft) for a rails/filler pair; raises ValueError if the pair is not priced."""
+    # Dense rate matrix lookup by material id, NaN if the pair is not priced
+    R_base = base_rate(rails_material, filler_material)
+    if math.isnan(R_base):
+        raise ValueError(f"Pricing not defined for material combination: {(rails_material, filler_material)}")
+    return R_base
+
+def _psf_rate_kernel(R_base, thickness_surcharge, core_table, core_id):
+    """
+    Combines the PSF Rate from its parts: the base rate, the thickness terms from
+    _thickness_terms and a CoreOption. Shared by every pricing path.
+    """
+    PSF_rate = R_base + thickness_surcharge
+    
+    # Conditional Core Surcharge (table lookup instead of string comparisons)
+    PSF_rate += core_table[core_id]
     
-    return round(PSF_rate, 2)
+    return PSF_rate
 
-def calculate_skeleton_cost(L_mm, W_mm, T_mm, rails, filler, core_option):
-    """Calculates the base cost of the door structure (Skeleton Cost)."""
-    psf_rate = get_psf_rate(rails, filler, T_mm, core_option)
-    area_1x = calculate_area_sqft(L_mm, W_mm, factor=1)
-    return round(area_1x * psf_rate, 2)
+def get_psf_rate(rails_material, filler_material, T_mm, core_option):
+    """Calculates the final dynamic PSF Rate (INR/sqft) for the door skeleton."""
+    # 1. Base Material Lookup
+    R_base = _material_base_rate(rails_material, filler_material)
+
+    # 2. Thickness Surcharge, and the core surcharge table for the thickness bucket
+    thickness_surcharge, core_table = _thickness_terms(T_mm)
 
-def calculate_finish_cost(L_mm, W_mm, door_type, finish_option):
+    # 3. Combined with the Core Surcharge
+    return _psf_rate_kernel(R_base, thickness_surcharge, core_table, _parse_core(core_option))
+
+def calculate_finish_cost(area_1x, door_type, finish_option):
     """Calculates the primary material finishing cost (Laminate is fixed, Veneer is 2x Area)."""
-    if door_type == "Laminate":
-        rate = LAMINATE_RATES.get(finish_option)
-        return round(rate, 2) if rate is not None else 0.0
+    door_type = _parse_door_type(door_type)
+    if door_type is DoorType.LAMINATE:
+        return _LAMINATE_RATES.get(finish_option, 0.0)
     
-    elif door_type == "Veneer":
+    elif door_type is DoorType.VENEER:
         rate = VENEER_RATES.get(finish_option)
         if rate is not None:
             # FIX: Ensure calculation proceeds if rate is found
-            area_2x = calculate_area_sqft(L_mm, W_mm, factor=2)
-            return round(area_2x * rate, 2)
+            area_2x = 2 * area_1x
+            return area_2x * rate
     return 0.0
 
-def calculate_addon_cost(L_mm, W_mm, T_mm, skeleton_cost, add_ons):
-    """Calculates the total cost for all optional add-ons."""
+def calculate_addon_cost(area_1x, edge_area, T_mm, skeleton_cost, add_ons):
+    """Calculates the total cost for all optional add-ons (add_ons: AddOns or the equivalent dict)."""
+    add_ons = _normalize_addons(add_ons)
+    # Binary search over the sorted thickness bands (0.0 if none covers T_mm)
+    vh_fee = vision_hole_fee(T_mm) if add_ons.vision_hole else 0.0
+    return _addon_total(area_1x, edge_area, vh_fee, skeleton_cost, add_ons)
+
+def _addon_total(area_1x, edge_area, vh_fee, skeleton_cost, add_ons):
+    """Add-on total for normalized add_ons, with the vision hole fee for the door thickness already resolved."""
     total_addon_cost = 0.0
-    area_1x_sqft = calculate_area_sqft(L_mm, W_mm, factor=1)
 
     # 1. Double Leaf Surcharge (Percentage-Based)
-    if add_ons.get('double_leaf', 'no').lower() == 'yes':
-        total_addon_cost += skeleton_cost * CONSTANTS["DOUBLE_LEAF_FACTOR"]
+    if add_ons.double_leaf:
+        total_addon_cost += skeleton_cost * _DL_FACTOR
     
     # 2. Vision Hole (Fixed Fee, Conditional on Thickness)
-    if add_ons.get('vision_hole', 'no').lower() == 'yes':
-        vh_fee = next((f["F_VH"] for f in VISION_HOLE_FEES 
-                       if f["T_min"] <= T_mm <= f["T_max"]), 0.0)
+    if add_ons.vision_hole:
         total_addon_cost += vh_fee
 
     # 3. Edge Banding (Edge Surface Area Based)
-    if add_ons.get('edge_banding', 'yes').lower() == 'yes': 
-        edge_area_sqft = calculate_edge_area_sqft(L_mm, W_mm, T_mm)
-        total_addon_cost += edge_area_sqft * CONSTANTS["EDGE_BANDING_RATE"]
+    if add_ons.edge_banding:
+        total_addon_cost += edge_area * _EB_RATE
 
     # 4. Area-Based Add-ons (Coating, Grooving, Routing)
-    area_addons_map = {
-        'coating': 'Coating', 
-        'grooving': 'Grooving', 
-        'routing': 'Routing'
-    }
-    
-    for addon_key, prefix in area_addons_map.items():
-        option = add_ons.get(addon_key, 'none')
-        if option.lower() != 'none':
-            # FIX: Simplify key generation for accurate dictionary lookup (e.g., 'Resin Coated (Both Sides)' -> 'Resin_Coated_Both_Sides')
-            # Assuming options are formatted like "Option Name (Side)" or just "Option Name"
-            
-            # This generates the exact key: e.g., 'Coating_Resin_Both_Sides'
-            lookup_key = f"{prefix}_{'_'.join(option.split()).replace('(', '').replace(')', '')}" 
-            rate = ADDON_SQFT_RATES.get(lookup_key)
-            
+    for addon_field, prefix in _AREA_ADDONS:
+        option = getattr(add_ons, addon_field)
+        if option is not None:
+            rate = _area_addon_rate(prefix, option)
             if rate:
-                total_addon_cost += area_1x_sqft * rate
-            else:
-                print(f"[DEBUG ERROR] Add-on rate not found for key: {lookup_key}")
+                total_addon_cost += area_1x * rate
                 
-    return round(total_addon_cost, 2)
+    return total_addon_cost
 
-def calculate_total_price(L_mm, W_mm, T_mm, rails, filler, core_option, door_type, finish_option, add_ons):
-    """Orchestrates the entire pricing process."""
-    
-    skeleton_cost = calculate_skeleton_cost(L_mm, W_mm, T_mm, rails, filler, core_option)
-    finish_cost = calculate_finish_cost(L_mm, W_mm, door_type, finish_option)
-    addon_cost = calculate_addon_cost(L_mm, W_mm, T_mm, skeleton_cost, add_ons)
-    
-    total_price = skeleton_cost + finish_cost + addon_cost
-    
+def _round_quote(skeleton_cost, finish_cost, addon_cost):
+    """
+    Rounds the unrounded cost components once, for the quote, to whole paise;
+    the total is the exact integer sum. Returns (skeleton, finish, addon, total) in INR.
+    """
+    skeleton_paise = round(skeleton_cost * _PAISE_PER_INR)
+    finish_paise = round(finish_cost * _PAISE_PER_INR)
+    addon_paise = round(addon_cost * _PAISE_PER_INR)
+    total_paise = skeleton_paise + finish_paise + addon_paise
+    return (skeleton_paise / _PAISE_PER_INR, finish_paise / _PAISE_PER_INR,
+            addon_paise / _PAISE_PER_INR, total_paise / _PAISE_PER_INR)
+
+def _quote_dict(quote):
+    """Packs a (skeleton, finish, addon, total) tuple into the result dict."""
+    skeleton_cost, finish_cost, addon_cost, total_price = quote
     return {
         "skeleton_cost": skeleton_cost,
         "finish_cost": finish_cost,
         "addon_cost": addon_cost,
-        "total_price": round(total_price, 2)
+        "total_price": total_price
     }
 
+@functools.lru_cache(maxsize=1024)
+def _calculate_total_price_cached(L_mm, W_mm, T_mm, rails, filler, core_option, door_type, finish_option, add_ons):
+    """Prices one normalized door spec (CoreOption, DoorType or None, AddOns); returns (skeleton, finish, addon, total)."""
+    # Areas are computed once and shared by every cost component.
+    area_1x = calculate_area_sqft(L_mm, W_mm, factor=1)
+    edge_area = calculate_edge_area_sqft(L_mm, W_mm, T_mm)
+    psf_rate = get_psf_rate(rails, filler, T_mm, core_option)
+
+    # Skeleton (base structure) cost: area times the PSF rate
+    skeleton_cost = area_1x * psf_rate
+    finish_cost = calculate_finish_cost(area_1x, door_type, finish_option)
+    addon_cost = calculate_addon_cost(area_1x, edge_area, T_mm, skeleton_cost, add_ons)
+    
+    # Helpers return unrounded values; round once here, for the quote.
+    return _round_quote(skeleton_cost, finish_cost, addon_cost)
+
+def calculate_total_price(L_mm, W_mm, T_mm, rails, filler, core_option, door_type, finish_option, add_ons):
+    """
+    Orchestrates the entire pricing process. core_option and door_type may be
+    names or CoreOption/DoorType values. Repeated specs are served from a cache.
+    """
+    
+    return _quote_dict(_calculate_total_price_cached(
+        L_mm, W_mm, T_mm, rails, filler, _parse_core(core_option), _parse_door_type(door_type),
+        finish_option, _normalize_addons(add_ons)
+    ))
+
+# --- Fixed-Thickness Pricing ---
+
+def make_pricer(T_mm):
+    """
+    Returns pricer(L_mm, W_mm, rails, filler, core_option, door_type, finish_option, add_ons)
+    for doors of one thickness. The thickness surcharge, core surcharge table and
+    vision hole fee are resolved once here, so sweeps over sizes and materials at a
+    fixed thickness skip them. Results match calculate_total_price.
+    """
+    thickness_surcharge, core_table = _thickness_terms(T_mm)
+    vh_fee = vision_hole_fee(T_mm)
+
+    def pricer(L_mm, W_mm, rails, filler, core_option, door_type, finish_option, add_ons):
+        add_ons = _normalize_addons(add_ons)
+        area_1x = calculate_area_sqft(L_mm, W_mm, factor=1)
+        edge_area = calculate_edge_area_sqft(L_mm, W_mm, T_mm)
+
+        PSF_rate = _psf_rate_kernel(_material_base_rate(rails, filler), thickness_surcharge, core_table,
+                                    _parse_core(core_option))
+        skeleton_cost = area_1x * PSF_rate
+        finish_cost = calculate_finish_cost(area_1x, door_type, finish_option)
+        addon_cost = _addon_total(area_1x, edge_area, vh_fee, skeleton_cost, add_ons)
+        return _quote_dict(_round_quote(skeleton_cost, finish_cost, addon_cost))
+
+    return pricer
+
+# --- Batch Pricing ---
+
+def _price_batch_kernel(L_mm, W_mm, T_mm, rails, filler, core_option, door_type, finish_option, add_ons):
+    """
+    Prices a run of doors given column-wise, as calculate_total_price_batch does;
+    returns the (skeleton, finish, addon, total) columns as lists. Doors are
+    independent, so each worker of a parallel batch runs this over its own chunk.
+    """
+    # 1. Geometry and vision hole fees, column-wise (memoized area helpers, so
+    #    repeated sizes are dict hits)
+    areas_1x = list(map(calculate_area_sqft, L_mm, W_mm))
+    edge_areas = list(map(calculate_edge_area_sqft, L_mm, W_mm, T_mm))
+    vh_fees = vision_hole_fee_batch(T_mm)
+
+    skeleton_costs, finish_costs, addon_costs, total_prices = [], [], [], []
+    for T, r, f, core, d_type, finish, door_add_ons, area_1x, edge_area, vh_fee in zip(
+            T_mm, rails, filler, core_option, door_type, finish_option, add_ons,
+            areas_1x, edge_areas, vh_fees):
+        # 2. Skeleton, finish and add-ons through the same helpers as a single quote
+        skeleton_cost = area_1x * get_psf_rate(r, f, T, core)
+        finish_cost = calculate_finish_cost(area_1x, d_type, finish)
+        addon_cost = _addon_total(area_1x, edge_area, vh_fee, skeleton_cost, _normalize_addons(door_add_ons))
+
+        # 3. Round once, for the quote
+        skeleton_cost, finish_cost, addon_cost, total_price = _round_quote(skeleton_cost, finish_cost, addon_cost)
+        skeleton_costs.append(skeleton_cost)
+        finish_costs.append(finish_cost)
+        addon_costs.append(addon_cost)
+        total_prices.append(total_price)
+
+    return skeleton_costs, finish_costs, addon_costs, total_prices
+
+# calculate_total_price_batch column arguments, in order (for error messages)
+_BATCH_COLUMNS = ("L_mm", "W_mm", "T_mm", "rails", "filler", "core_option", "door_type", "finish_option", "add_ons")
+
+def _check_column_lengths(names, columns):
+    """Raises ValueError unless every column has the same length as the first."""
+    n_doors = len(columns[0])
+    mismatched = [f"{name}={len(column)}" for name, column in zip(names, columns) if len(column) != n_doors]
+    if mismatched:
+        raise ValueError(f"All columns must have one entry per door ({names[0]}={n_doors}); got {', '.join(mismatched)}")
+
+def calculate_total_price_batch(L_mm, W_mm, T_mm, rails, filler, core_option, door_type, finish_option, add_ons,
+                                workers=None):
+    """
+    Prices many doors in one pass. Each argument is a sequence (or any iterable)
+    with one entry per door, in the same form calculate_total_price takes (add_ons
+    holds AddOns or dicts). Returns a dict of lists with the same keys as
+    calculate_total_price. The areas are computed column-wise, and each door is
+    priced by the same helpers as calculate_total_price, so results match
+    pricing each door individually. Columns of different lengths raise ValueError.
+    With workers > 1 the doors are split into that many chunks, priced in
+    parallel worker processes; worth it only for large sweeps.
+    """
+    # The kernel reads the size columns more than once, so iterators are materialized first.
+    columns = [list(column) for column in
+               (L_mm, W_mm, T_mm, rails, filler, core_option, door_type, finish_option, add_ons)]
+    # zip() in the kernel would silently drop the doors beyond the shortest column.
+    _check_column_lengths(_BATCH_COLUMNS, columns)
+    if workers is None or workers <= 1:
+        skeleton_costs, finish_costs, addon_costs, total_prices = _price_batch_kernel(*columns)
+    else:
+        chunk_size = max(1, -(-len(columns[0]) // workers))
+        chunk_starts = range(0, len(columns[0]), chunk_size)
+        chunks = [[column[i:i + chunk_size] for i in chunk_starts] for column in columns]
+        skeleton_costs, finish_costs, addon_costs, total_prices = [], [], [], []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields chunk results in submission order, so door order is kept.
+            for skeletons, finishes, addons, totals in pool.map(_price_batch_kernel, *chunks):
+                skeleton_costs += skeletons
+                finish_costs += finishes
+                addon_costs += addons
+                total_prices += totals
+
+    return {
+        "skeleton_cost": skeleton_costs,
+        "finish_cost": finish_costs,
+        "addon_cost": addon_costs,
+        "total_price": total_prices
+    }
+
+# Door spec columns of a pricing table, in calculate_total_price argument order
+_TABLE_COLUMNS = ("L_mm", "W_mm", "T_mm", "rails", "filler", "core_option", "door_type", "finish_option")
+
+def calculate_total_price_table(table, workers=None):
+    """
+    Prices a table of doors held column-wise: any mapping of column name to a
+    sequence, e.g. a dict of lists or a pandas DataFrame. Required columns are
+    L_mm, W_mm, T_mm, rails, filler, core_option, door_type and finish_option;
+    add-ons come from optional columns named like the AddOns fields, holding the
+    same values as the add_ons dict ('yes'/'no', option names or 'none').
+    Missing add-on columns take the usual defaults. Every column used must have
+    one entry per door (ValueError otherwise). Returns the cost columns as
+    calculate_total_price_batch does; workers is passed through to it.
+    """
+    addon_names = [name for name in AddOns._fields if name in table]
+    columns = [list(table[name]) for name in _TABLE_COLUMNS]
+    addon_columns = [list(table[name]) for name in addon_names]
+    # Add-on columns are zipped row-wise below, which would drop rows silently.
+    _check_column_lengths(_TABLE_COLUMNS + tuple(addon_names), columns + addon_columns)
+    if addon_names:
+        add_ons = [dict(zip(addon_names, row)) for row in zip(*addon_columns)]
+    else:
+        add_ons = [{}] * len(columns[0])
+    return calculate_total_price_batch(*columns, add_ons, workers=workers)
+
 # --- Example of running the calculation ---
 if __name__ == '__main__':
     # --- Sample Input Data ---